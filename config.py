@@ -40,17 +40,13 @@ REDACTION_PATTERNS = {
 PERFORMANCE_TARGET_MS = 200  # Target processing time in milliseconds
 ENABLE_PERFORMANCE_MONITORING = True
 
-# Security settings
-ENABLE_CONTENT_HASHING = True  # Use hashing to detect clipboard changes
-HASH_ALGORITHM = "md5"         # Hashing algorithm (md5, sha1, sha256)
-
 # Presidio settings
 PRESIDIO_CONFIDENCE_THRESHOLD = 0.5  # Minimum confidence for PII detection (0.0-1.0)
 PRESIDIO_LANGUAGE = "en"             # Language for analysis
 
 # Development settings
 SAVE_REDACTION_EXAMPLES = False  # Save examples for testing/improvement
-EXAMPLES_FILE = "redaction_examples.json"
+EXAMPLES_FILE = "redaction_examples.jsonl"  # Newline-delimited JSON, trimmed to 100 entries at startup
 
 # Validation function for configuration
 def validate_config():
@@ -72,13 +68,10 @@ def validate_config():
     if PERFORMANCE_TARGET_MS <= 0:
         errors.append("PERFORMANCE_TARGET_MS must be positive")
     
-    if HASH_ALGORITHM not in ["md5", "sha1", "sha256"]:
-        errors.append("HASH_ALGORITHM must be one of: md5, sha1, sha256")
-    
     return errors
 
 # Load configuration from environment variables (optional)
-def load_from_env():
+def _load_from_env():
     """Load configuration from environment variables"""
     import os
     
@@ -100,10 +93,12 @@ def load_from_env():
         except ValueError:
             pass
 
+# Apply environment overrides once, at import time
+_load_from_env()
+
 # Initialize configuration
 if __name__ == "__main__":
     # Validate configuration when run directly
-    load_from_env()
     errors = validate_config()
     
     if errors:
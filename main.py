@@ -4,16 +4,25 @@ Real-Time Clipboard Redactor for Windows
 Monitors clipboard content and redacts PII using Microsoft Presidio
 """
 
+import re
+import sys
+import copy
+import hashlib
 import time
+import collections
 import threading
 import logging
-import hashlib
+import queue
+import json
+from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 try:
     import pyperclip
-    from presidio_analyzer import AnalyzerEngine
+    import spacy
+    from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine
+    from presidio_analyzer.nlp_engine import NlpEngineProvider
     from presidio_anonymizer import AnonymizerEngine
     from presidio_anonymizer.entities import OperatorConfig
     from config import *  # Import configuration settings
@@ -24,6 +33,232 @@ except ImportError as e:
     exit(1)
 
 
+# Cheap structural check for PII candidates (emails, digit runs, capitalized
+# name pairs, IPv4 and crypto addresses, date and time shapes); content without
+# a match skips Presidio
+_PII_PREFILTER = re.compile(
+    r'@|\d{3,}|[A-Z][a-z]+ [A-Z][a-z]+|(?:\d{1,3}\.){3}\d{1,3}|bc1[a-z0-9]{10,}|0x[a-fA-F0-9]{20,}'
+    r'|\d{1,4}[/.-]\d{1,2}'                                                   # 3/4/85, 2024-01-15
+    r'|\b\d{1,2}(?::\d{2}|\s?[ap]\.?m\b)'                                     # 10:30, 5pm
+    r'|(?i:\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d)'  # March 3rd
+    r'|(?i:\d\s*(?:st|nd|rd|th)?\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec))'  # 3rd March
+    r'|(?i:\b(?:today|tonight|tomorrow|yesterday|noon|midnight|(?:mon|tues|wednes|thurs|fri|satur|sun)day)\b)'
+)
+
+# Content shorter than this always goes to Presidio; its NER entities (names,
+# places, free-form dates) have too many shapes for the prefilter to catch
+_PREFILTER_MIN_LENGTH = 200
+
+# Blank line between paragraphs, with either LF or CRLF line endings
+_PARAGRAPH_BREAK = re.compile(r'\r?\n\s*\r?\n')
+
+
+# Regex fast path for small clipboards, used only when every configured entity
+# has a pattern here; order matters so IP addresses and crypto addresses are
+# replaced before the phone number pattern can match them
+_FAST_REDACT_MAX = 128
+_FAST_PATTERNS = {
+    "EMAIL_ADDRESS": re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}"),
+    "IP_ADDRESS": re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b"),
+    "CRYPTO": re.compile(
+        r"\b[13][a-km-zA-HJ-NP-Z1-9]{25,34}\b"   # Base58Check (validated below)
+        r"|\bbc1[ac-hj-np-z02-9]{25,39}\b"       # Bech32
+        r"|\b0x[a-fA-F0-9]{40}\b"                # Ethereum
+    ),
+    # Digit groups joined by separators, e.g. 555-123-4567, +1 (555) 123-4567,
+    # +44 20 7946 0958; dates, times and unseparated digit runs don't match
+    "PHONE_NUMBER": re.compile(
+        r"(?<![\w.])(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)[\s.-]?|\d{2,4}[\s.-])\d{3,4}[\s.-]\d{3,4}(?![\w/:-]|\.\d)"
+    ),
+}
+
+# Anything number- or email-like left after fast redaction sends the content to Presidio
+_FAST_RESIDUAL = re.compile(r"\d{3,}|@")
+
+_HEX_STRING = re.compile(r"[0-9a-fA-F]+")
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def _is_valid_base58check(address: str) -> bool:
+    """Check the length and double-SHA256 checksum of a Base58Check address"""
+    number = 0
+    for char in address:
+        index = _BASE58_ALPHABET.find(char)
+        if index < 0:
+            return False
+        number = number * 58 + index
+    
+    leading_zeros = len(address) - len(address.lstrip("1"))
+    raw = b"\0" * leading_zeros + number.to_bytes((number.bit_length() + 7) // 8, "big")
+    if len(raw) != 25:
+        return False
+    return hashlib.sha256(hashlib.sha256(raw[:-4]).digest()).digest()[:4] == raw[-4:]
+
+
+def _is_valid_crypto(address: str) -> bool:
+    """Reject CRYPTO pattern matches that are not plausible wallet addresses"""
+    if address.startswith("0x"):
+        return True
+    if address.startswith("bc1"):
+        # Hex digests such as git SHAs can fall inside the Bech32 charset
+        return not _HEX_STRING.fullmatch(address)
+    return _is_valid_base58check(address)
+
+
+_FAST_VALIDATORS = {"CRYPTO": _is_valid_crypto}
+
+# Number of analyzer results kept for repeatedly copied content
+_ANALYSIS_CACHE_SIZE = 128
+
+
+# Win32 clipboard listener support (Windows only)
+WM_CLOSE = 0x0010
+WM_CLIPBOARDUPDATE = 0x031D
+HWND_MESSAGE = -3
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    LRESULT = ctypes.c_ssize_t
+    WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+    class WNDCLASSW(ctypes.Structure):
+        _fields_ = [
+            ('style', wintypes.UINT),
+            ('lpfnWndProc', WNDPROC),
+            ('cbClsExtra', ctypes.c_int),
+            ('cbWndExtra', ctypes.c_int),
+            ('hInstance', wintypes.HINSTANCE),
+            ('hIcon', wintypes.HICON),
+            ('hCursor', wintypes.HANDLE),
+            ('hbrBackground', wintypes.HBRUSH),
+            ('lpszMenuName', wintypes.LPCWSTR),
+            ('lpszClassName', wintypes.LPCWSTR),
+        ]
+
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+    user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+    user32.DefWindowProcW.restype = LRESULT
+    user32.RegisterClassW.argtypes = [ctypes.POINTER(WNDCLASSW)]
+    user32.RegisterClassW.restype = wintypes.ATOM
+    user32.UnregisterClassW.argtypes = [wintypes.LPCWSTR, wintypes.HINSTANCE]
+    user32.CreateWindowExW.argtypes = [
+        wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID
+    ]
+    user32.CreateWindowExW.restype = wintypes.HWND
+    user32.DestroyWindow.argtypes = [wintypes.HWND]
+    user32.AddClipboardFormatListener.argtypes = [wintypes.HWND]
+    user32.AddClipboardFormatListener.restype = wintypes.BOOL
+    user32.RemoveClipboardFormatListener.argtypes = [wintypes.HWND]
+    user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+    user32.GetMessageW.restype = wintypes.BOOL
+    user32.TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+    user32.DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+    user32.DispatchMessageW.restype = LRESULT
+    user32.PostMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+    user32.PostMessageW.restype = wintypes.BOOL
+    user32.PostQuitMessage.argtypes = [ctypes.c_int]
+    user32.GetClipboardSequenceNumber.restype = wintypes.DWORD
+    kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+    kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+    # Incremented by the OS on every clipboard change
+    _GetClipboardSequenceNumber = user32.GetClipboardSequenceNumber
+else:
+    _GetClipboardSequenceNumber = None
+
+
+class _WinClipboardListener:
+    """Receives WM_CLIPBOARDUPDATE notifications through a hidden message-only window"""
+
+    CLASS_NAME = "ClipreClipboardListener"
+
+    def __init__(self, on_update):
+        """
+        Args:
+            on_update: Callback invoked (with no arguments) whenever the clipboard changes
+        """
+        self.on_update = on_update
+        self.hwnd = None
+        # Set once run() has created the window, or has given up trying
+        self.ready = threading.Event()
+        # Keep a reference to the callback so it is not garbage collected
+        self._wndproc = WNDPROC(self._window_proc)
+
+    def _window_proc(self, hwnd, msg, wparam, lparam):
+        if msg == WM_CLIPBOARDUPDATE:
+            self.on_update()
+            return 0
+        if msg == WM_CLOSE:
+            # Window is destroyed by run() once the message loop has exited
+            user32.PostQuitMessage(0)
+            return 0
+        return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+    def run(self):
+        """Create the listener window and pump messages until stop() is called"""
+        hinstance = kernel32.GetModuleHandleW(None)
+
+        wndclass = WNDCLASSW()
+        wndclass.lpfnWndProc = self._wndproc
+        wndclass.hInstance = hinstance
+        wndclass.lpszClassName = self.CLASS_NAME
+        if not user32.RegisterClassW(ctypes.byref(wndclass)):
+            self.ready.set()
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        hwnd = None
+        try:
+            hwnd = user32.CreateWindowExW(
+                0, self.CLASS_NAME, self.CLASS_NAME, 0,
+                0, 0, 0, 0, HWND_MESSAGE, None, hinstance, None
+            )
+            if not hwnd:
+                raise ctypes.WinError(ctypes.get_last_error())
+            if not user32.AddClipboardFormatListener(hwnd):
+                raise ctypes.WinError(ctypes.get_last_error())
+
+            self.hwnd = hwnd
+            self.ready.set()
+
+            msg = wintypes.MSG()
+            # GetMessageW returns 0 on WM_QUIT and -1 on error
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            self.hwnd = None
+            self.ready.set()
+            if hwnd:
+                user32.RemoveClipboardFormatListener(hwnd)
+                user32.DestroyWindow(hwnd)
+            user32.UnregisterClassW(self.CLASS_NAME, hinstance)
+
+    def stop(self, timeout: float = 2) -> bool:
+        """
+        Ask the message loop to exit
+
+        Args:
+            timeout: How long to wait for run() to create its window (seconds)
+
+        Returns:
+            True if the listener was told to exit or is not running, False otherwise
+        """
+        if not self.ready.wait(timeout):
+            return False
+
+        hwnd = self.hwnd
+        if hwnd is None:
+            # run() failed or has already exited
+            return True
+        return bool(user32.PostMessageW(hwnd, WM_CLOSE, 0, 0))
+
+
 class ClipboardRedactor:
     """Real-time clipboard monitor and PII redactor"""
     
@@ -35,8 +270,7 @@ class ClipboardRedactor:
             poll_interval: How often to check clipboard (seconds) - uses config if None
             log_level: Logging level - uses config if None
         """
-        # Load configuration
-        load_from_env()  # Load environment overrides
+        # Validate configuration (environment overrides are applied when config is imported)
         config_errors = validate_config()
         if config_errors:
             print("Configuration errors:")
@@ -45,8 +279,23 @@ class ClipboardRedactor:
             raise ValueError("Invalid configuration")
         
         self.poll_interval = poll_interval or CLIPBOARD_POLL_INTERVAL
+        
+        # Adaptive polling: back off while the clipboard is idle, snap back on change
+        self._idle_interval = self.poll_interval
+        self._max_interval = max(self.poll_interval, min(1.0, 10 * self.poll_interval))
         self.running = False
-        self.last_clipboard_hash = None
+        self.listener = None
+        self.monitor_thread = None
+        self.fatal_error = None
+        self._last_content = ""
+        self._last_seq = 0
+        
+        # Recently produced redacted outputs, skipped when they come back through the clipboard
+        self._recent_redactions = collections.deque(maxlen=8)
+        self._recent_redactions_set = set()
+        
+        # LRU cache of analyzer results keyed by the exact analyzed text
+        self._analysis_cache = collections.OrderedDict()
         
         # Setup logging
         log_handlers = []
@@ -61,38 +310,166 @@ class ClipboardRedactor:
         )
         self.logger = logging.getLogger(__name__)
         
-        # Initialize Presidio engines
-        self.logger.info("Initializing Presidio engines...")
-        try:
-            self.analyzer = AnalyzerEngine()
-            self.anonymizer = AnonymizerEngine()
-            self.logger.info("Presidio engines initialized successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize Presidio: {e}")
-            raise
+        # Presidio engines are loaded in the background by start(), see _ensure_engines()
+        self._analyzer_lazy = None
+        self._anonymizer_lazy = None
+        self._batch_analyzer_lazy = None
+        self._engines_lock = threading.RLock()
+        
+        # Redaction examples are written by a background thread (see start()) to keep
+        # file I/O off the monitor thread
+        self._examples_thread = None
+        if SAVE_REDACTION_EXAMPLES:
+            self._compact_examples()
+            self._examples_queue = queue.Queue(maxsize=256)
         
         # Performance metrics
         self.stats = {
             'total_checks': 0,
             'redactions_performed': 0,
             'avg_processing_time': 0,
+            'max_processing_time': 0,
             'false_positives': 0,
             'start_time': datetime.now()
         }
+        self._total_time_ms = 0.0
         
         # Use configured PII entities
         self.pii_entities = PII_ENTITIES.copy()
-        self.logger.info(f"Monitoring {len(self.pii_entities)} PII entity types")
-        self.logger.debug(f"PII entities: {', '.join(self.pii_entities)}")
-
-    def _get_clipboard_hash(self, text: str) -> str:
-        """Generate hash of clipboard content for change detection"""
-        if HASH_ALGORITHM == "sha256":
-            return hashlib.sha256(text.encode('utf-8')).hexdigest()
-        elif HASH_ALGORITHM == "sha1":
-            return hashlib.sha1(text.encode('utf-8')).hexdigest()
-        else:  # default to md5
-            return hashlib.md5(text.encode('utf-8')).hexdigest()
+        self.logger.info("Monitoring %d PII entity types", len(self.pii_entities))
+        self.logger.debug("PII entities: %s", ', '.join(self.pii_entities))
+        
+        # Precompute per-call analysis and redaction settings
+        self._entities = tuple(self.pii_entities)
+        self._lang = PRESIDIO_LANGUAGE
+        self._threshold = PRESIDIO_CONFIDENCE_THRESHOLD
+        self._perf_target = PERFORMANCE_TARGET_MS
+        self._perf_mon = ENABLE_PERFORMANCE_MONITORING
+        self._operators = {
+            entity_type: OperatorConfig("replace", {"new_value": redaction_text})
+            for entity_type, redaction_text in REDACTION_PATTERNS.items()
+        }
+        
+        # Fast path patterns for the configured entities, with their replacement text;
+        # the fast path is only safe when it covers every configured entity
+        default_redaction = REDACTION_PATTERNS.get("DEFAULT", "[REDACTED]")
+        self._fast_patterns = [
+            (entity_type, pattern, REDACTION_PATTERNS.get(entity_type, default_redaction),
+             _FAST_VALIDATORS.get(entity_type))
+            for entity_type, pattern in _FAST_PATTERNS.items()
+            if entity_type in self._entities
+        ]
+        self._fast_path_enabled = bool(self._entities) and set(self._entities) <= set(_FAST_PATTERNS)
+        
+        # Engines load lazily, so catch a missing spaCy model now rather than on the first clipboard event
+        self._check_engine_dependencies()
+
+    def _check_engine_dependencies(self):
+        """Raise if the spaCy model Presidio will load for the configured language is not installed"""
+        nlp_configuration = NlpEngineProvider().nlp_configuration
+        if nlp_configuration.get("nlp_engine_name") != "spacy":
+            return
+        
+        for model in nlp_configuration.get("models", []):
+            if model["lang_code"] == self._lang and not spacy.util.is_package(model["model_name"]):
+                raise RuntimeError(
+                    f"spaCy model '{model['model_name']}' is not installed. "
+                    f"Run: python -m spacy download {model['model_name']}"
+                )
+
+    def _halt(self, error: Exception):
+        """Stop monitoring after a fatal error so redaction is never silently off"""
+        self.logger.critical("Clipboard redaction is disabled, stopping monitor: %s", error)
+        self.fatal_error = error
+        self.running = False
+        
+        # Forget the current clipboard so it is analyzed again if monitoring restarts
+        self._last_content = ""
+        self._last_seq = 0
+        
+        if self.listener:
+            self.listener.stop()
+
+    @property
+    def analyzer(self) -> AnalyzerEngine:
+        self._ensure_engines()
+        return self._analyzer_lazy
+
+    @property
+    def anonymizer(self) -> AnonymizerEngine:
+        self._ensure_engines()
+        return self._anonymizer_lazy
+
+    @property
+    def batch_analyzer(self) -> BatchAnalyzerEngine:
+        self._ensure_engines()
+        return self._batch_analyzer_lazy
+
+    def _ensure_engines(self):
+        """Create and warm up the Presidio engines the first time they are needed"""
+        if self._analyzer_lazy is not None:
+            return
+        
+        # A clipboard event during the background load waits for it instead of loading twice
+        with self._engines_lock:
+            if self._analyzer_lazy is None:
+                self._load_engines()
+
+    def _load_engines(self):
+        """Create the Presidio engines and warm them up"""
+        self.logger.info("Initializing Presidio engines...")
+        try:
+            analyzer = AnalyzerEngine()
+            self._anonymizer_lazy = AnonymizerEngine()
+            self._batch_analyzer_lazy = BatchAnalyzerEngine(analyzer_engine=analyzer)
+            self._analyzer_lazy = analyzer
+            self.logger.info("Presidio engines initialized successfully")
+        except Exception as e:
+            self.logger.error("Failed to initialize Presidio: %s", e)
+            raise
+        
+        # Pay the first-call model loading cost here rather than on the clipboard event
+        self._warm_up_engines()
+
+    def _warm_up_engines(self):
+        """Run a throwaway analysis and redaction so spaCy and Presidio finish loading"""
+        self.logger.info("Warming up analyzer...")
+        try:
+            sample = "John Doe john@example.com 555-123-4567"
+            results = self.analyzer.analyze(
+                text=sample,
+                entities=self._entities,
+                language=self._lang,
+                score_threshold=self._threshold
+            )
+            self.anonymizer.anonymize(text=sample, analyzer_results=results, operators=self._operators)
+            self.logger.info("Analyzer warm")
+        except Exception as e:
+            self.logger.warning("Analyzer warm-up failed: %s", e)
+
+    @staticmethod
+    def _split_paragraphs(text: str) -> list:
+        """
+        Split text into non-blank paragraphs
+        
+        Args:
+            text: Text to split
+            
+        Returns:
+            List of (offset, paragraph) tuples, offset being the paragraph's start in text
+        """
+        segments = []
+        offset = 0
+        for match in _PARAGRAPH_BREAK.finditer(text):
+            paragraph = text[offset:match.start()]
+            if paragraph.strip():
+                segments.append((offset, paragraph))
+            offset = match.end()
+        
+        paragraph = text[offset:]
+        if paragraph.strip():
+            segments.append((offset, paragraph))
+        return segments
 
     def _analyze_text(self, text: str) -> list:
         """
@@ -104,35 +481,75 @@ class ClipboardRedactor:
         Returns:
             List of detected PII entities
         """
+        logger = self.logger
+        stats = self.stats
+        
+        # Results carry positions, so only an exact text match can be reused
+        cached = self._analysis_cache.get(text)
+        if cached is not None:
+            self._analysis_cache.move_to_end(text)
+            logger.debug("Analysis cache hit, found %d entities", len(cached))
+            # The anonymizer adjusts results in place, so hand out copies
+            return [copy.copy(r) for r in cached]
+        
         try:
-            start_time = time.time()
-            results = self.analyzer.analyze(
-                text=text,
-                entities=self.pii_entities,
-                language=PRESIDIO_LANGUAGE,
-                score_threshold=PRESIDIO_CONFIDENCE_THRESHOLD
-            )
-            processing_time = (time.time() - start_time) * 1000  # Convert to ms
-            
-            # Update performance stats
-            if ENABLE_PERFORMANCE_MONITORING:
-                self.stats['total_checks'] += 1
-                self.stats['avg_processing_time'] = (
-                    (self.stats['avg_processing_time'] * (self.stats['total_checks'] - 1) + processing_time) 
-                    / self.stats['total_checks']
+            self._ensure_engines()
+        except Exception as e:
+            self._halt(e)
+            return []
+        
+        start_time = time.time()
+        segments = self._split_paragraphs(text)
+        
+        try:
+            if len(segments) <= 1:
+                results = self.analyzer.analyze(
+                    text=text,
+                    entities=self._entities,
+                    language=self._lang,
+                    score_threshold=self._threshold
+                )
+            else:
+                # Run paragraphs through spaCy's nlp.pipe as one batch
+                results_per_segment = self.batch_analyzer.analyze_iterator(
+                    [segment for _, segment in segments],
+                    language=self._lang,
+                    entities=self._entities,
+                    score_threshold=self._threshold
                 )
-            
-            self.logger.debug(f"Analysis completed in {processing_time:.2f}ms, found {len(results)} entities")
-            
-            # Check performance target
-            if ENABLE_PERFORMANCE_MONITORING and processing_time > PERFORMANCE_TARGET_MS:
-                self.logger.warning(f"Processing time {processing_time:.2f}ms exceeds target {PERFORMANCE_TARGET_MS}ms")
-            
-            return results
-            
         except Exception as e:
-            self.logger.error(f"Error analyzing text: {e}")
+            logger.error("Error analyzing text: %s", e)
             return []
+        
+        if len(segments) > 1:
+            # Map segment-relative positions back onto the original text
+            results = []
+            for (offset, _), segment_results in zip(segments, results_per_segment):
+                for result in segment_results:
+                    result.start += offset
+                    result.end += offset
+                results.extend(segment_results)
+        
+        processing_time = (time.time() - start_time) * 1000  # Convert to ms
+        
+        # Update performance stats
+        if self._perf_mon:
+            stats['total_checks'] += 1
+            self._total_time_ms += processing_time
+            stats['avg_processing_time'] = self._total_time_ms / stats['total_checks']
+            stats['max_processing_time'] = max(stats['max_processing_time'], processing_time)
+        
+        logger.debug("Analysis completed in %.2fms, found %d entities", processing_time, len(results))
+        
+        # Check performance target
+        if self._perf_mon and processing_time > self._perf_target:
+            logger.warning("Processing time %.2fms exceeds target %sms", processing_time, self._perf_target)
+        
+        self._analysis_cache[text] = [copy.copy(r) for r in results]
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        
+        return results
 
     def _redact_text(self, text: str, analyzer_results: list) -> str:
         """
@@ -145,26 +562,41 @@ class ClipboardRedactor:
         Returns:
             Redacted text
         """
+        if not analyzer_results:
+            return text
+        
         try:
-            if not analyzer_results:
-                return text
-            
-            # Configure redaction operators using config
-            operators = {}
-            for entity_type, redaction_text in REDACTION_PATTERNS.items():
-                operators[entity_type] = OperatorConfig("replace", {"new_value": redaction_text})
-            
             anonymized_result = self.anonymizer.anonymize(
                 text=text,
                 analyzer_results=analyzer_results,
-                operators=operators
+                operators=self._operators
             )
-            
-            return anonymized_result.text
-            
         except Exception as e:
-            self.logger.error(f"Error redacting text: {e}")
+            self.logger.error("Error redacting text: %s", e)
             return text
+        
+        return anonymized_result.text
+
+    def _fast_redact(self, text: str) -> tuple:
+        """
+        Redact structural PII using compiled regexes, without Presidio
+        
+        Args:
+            text: Text to redact
+            
+        Returns:
+            Tuple of (redacted text, list of detected entity types)
+        """
+        detected_types = []
+        for entity_type, pattern, replacement, validate in self._fast_patterns:
+            def replace(match):
+                if validate is not None and not validate(match.group()):
+                    return match.group()
+                detected_types.append(entity_type)
+                return replacement
+            
+            text = pattern.sub(replace, text)
+        return text, detected_types
 
     def _process_clipboard_content(self, content: str) -> Optional[str]:
         """
@@ -179,9 +611,35 @@ class ClipboardRedactor:
         if not content or not content.strip():
             return None
         
+        # Skip content we produced ourselves
+        if content in self._recent_redactions_set:
+            self.logger.debug("Clipboard content is a recent redaction, skipping analysis")
+            return None
+        
         # Skip very long content to avoid performance issues
         if len(content) > MAX_CLIPBOARD_SIZE:
-            self.logger.warning(f"Skipping large clipboard content ({len(content)} chars, max: {MAX_CLIPBOARD_SIZE})")
+            self.logger.warning("Skipping large clipboard content (%d chars, max: %d)", len(content), MAX_CLIPBOARD_SIZE)
+            return None
+        
+        # Small clipboards can be handled by regex alone when the fast path covers
+        # every configured entity and leaves nothing number- or email-like behind
+        if self._fast_path_enabled and len(content) <= _FAST_REDACT_MAX:
+            redacted_content, detected_types = self._fast_redact(content)
+            
+            if detected_types and not _FAST_RESIDUAL.search(redacted_content):
+                self.stats['redactions_performed'] += 1
+                self.logger.info("PII detected (fast path): %s", ', '.join(set(detected_types)))
+                self.logger.info("Clipboard content redacted (%d entities)", len(detected_types))
+                
+                # Save redaction example if enabled
+                if SAVE_REDACTION_EXAMPLES:
+                    self._save_redaction_example(content, redacted_content, detected_types)
+                
+                return redacted_content
+        
+        # Skip Presidio on longer content when nothing looks like a PII candidate
+        if len(content) >= _PREFILTER_MIN_LENGTH and not _PII_PREFILTER.search(content):
+            self.logger.debug("No PII candidates in clipboard content, skipping analysis")
             return None
         
         # Analyze for PII
@@ -192,98 +650,211 @@ class ClipboardRedactor:
             return None
         
         # Log detected PII types (without content for privacy)
-        detected_types = [result.entity_type for result in pii_results]
-        confidence_scores = [f"{result.entity_type}({result.score:.2f})" for result in pii_results]
-        
-        self.logger.info(f"PII detected: {', '.join(set(detected_types))}")
-        self.logger.debug(f"PII details: {', '.join(confidence_scores)}")
+        self.logger.info("PII detected: %s", ', '.join({result.entity_type for result in pii_results}))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("PII details: %s", ', '.join(
+                f"{result.entity_type}({result.score:.2f})" for result in pii_results
+            ))
         
         # Redact the content
         redacted_content = self._redact_text(content, pii_results)
         
         if redacted_content != content:
             self.stats['redactions_performed'] += 1
-            self.logger.info(f"Clipboard content redacted ({len(pii_results)} entities)")
+            self.logger.info("Clipboard content redacted (%d entities)", len(pii_results))
             
             # Save redaction example if enabled
             if SAVE_REDACTION_EXAMPLES:
-                self._save_redaction_example(content, redacted_content, detected_types)
+                self._save_redaction_example(
+                    content, redacted_content, [result.entity_type for result in pii_results]
+                )
             
             return redacted_content
         
         return None
 
+    def _remember_redaction(self, redacted: str):
+        """Record redacted output so it is not re-analyzed when read back from the clipboard"""
+        if redacted in self._recent_redactions_set:
+            return
+        
+        # Keep the set in sync with the entry the deque is about to evict
+        if len(self._recent_redactions) == self._recent_redactions.maxlen:
+            self._recent_redactions_set.discard(self._recent_redactions[0])
+        
+        self._recent_redactions.append(redacted)
+        self._recent_redactions_set.add(redacted)
+
     def _save_redaction_example(self, original: str, redacted: str, pii_types: list):
-        """Save redaction example for analysis (if enabled)"""
+        """Queue redaction example for the background writer (if enabled)"""
+        example = {
+            "timestamp": datetime.now().isoformat(),
+            "original_length": len(original),
+            "redacted_length": len(redacted),
+            "pii_types": pii_types,
+            "redacted_text": redacted  # Only save redacted version for privacy
+        }
+        
         try:
-            import json
-            from pathlib import Path
+            self._examples_queue.put_nowait(example)
+        except queue.Full:
+            self.logger.debug("Redaction example queue full, dropping example")
+
+    def _write_examples(self):
+        """Background loop appending queued redaction examples to the examples file"""
+        done = False
+        
+        while not done:
+            examples = []
+            item = self._examples_queue.get()
             
-            example = {
-                "timestamp": datetime.now().isoformat(),
-                "original_length": len(original),
-                "redacted_length": len(redacted),
-                "pii_types": pii_types,
-                "redacted_text": redacted  # Only save redacted version for privacy
-            }
+            # Drain pending examples so they go out in a single write; None is
+            # the shutdown sentinel queued by stop()
+            while True:
+                if item is None:
+                    done = True
+                    break
+                examples.append(item)
+                if len(examples) >= 32:
+                    break
+                try:
+                    item = self._examples_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if not examples:
+                continue
             
+            try:
+                with open(EXAMPLES_FILE, 'a') as f:
+                    for example in examples:
+                        f.write(json.dumps(example) + '\n')
+            except Exception as e:
+                self.logger.error("Failed to save redaction examples: %s", e)
+
+    def _compact_examples(self):
+        """Trim the examples file to the last 100 examples"""
+        try:
             examples_file = Path(EXAMPLES_FILE)
-            examples = []
+            if not examples_file.exists():
+                return
+            
+            with open(examples_file, 'r') as f:
+                lines = f.readlines()
             
-            if examples_file.exists():
-                with open(examples_file, 'r') as f:
-                    examples = json.load(f)
+            if len(lines) > 100:
+                with open(examples_file, 'w') as f:
+                    f.writelines(lines[-100:])
+                    
+        except Exception as e:
+            self.logger.error("Failed to compact redaction examples: %s", e)
+
+    def _on_clipboard_update(self):
+        """Handle a clipboard change notification from the Win32 listener"""
+        try:
+            # Ignore the notification caused by our own redacted copy
+            seq = _GetClipboardSequenceNumber()
+            if seq == self._last_seq:
+                return
             
-            examples.append(example)
+            redacted_content = self._process_clipboard_content(pyperclip.paste())
             
-            # Keep only last 100 examples
-            if len(examples) > 100:
-                examples = examples[-100:]
+            if redacted_content:
+                # Update clipboard with redacted content
+                pyperclip.copy(redacted_content)
+                seq = _GetClipboardSequenceNumber()
+                self._remember_redaction(redacted_content)
+                self.logger.info("Clipboard updated with redacted content")
             
-            with open(examples_file, 'w') as f:
-                json.dump(examples, f, indent=2)
+            # Only mark the change as handled once it was read and processed
+            if self.running:
+                self._last_seq = seq
                 
         except Exception as e:
-            self.logger.error(f"Failed to save redaction example: {e}")
+            self.logger.error("Error handling clipboard update: %s", e)
+
+    def _listen_clipboard(self):
+        """Event-driven clipboard monitoring using Win32 clipboard notifications"""
+        self.logger.info("Starting clipboard monitoring (Win32 clipboard listener)...")
+        
+        try:
+            self.listener.run()
+        except OSError as e:
+            self.logger.error("Win32 clipboard listener failed: %s, falling back to polling", e)
+            self.listener = None
+            self._monitor_clipboard()
 
     def _monitor_clipboard(self):
         """Main clipboard monitoring loop"""
         self.logger.info("Starting clipboard monitoring...")
         
+        # pyperclip swaps in its real copy/paste functions on first use, so resolve
+        # them before binding hot-loop lookups to locals
+        try:
+            pyperclip.paste()
+        except Exception as e:
+            self.logger.error("Error in clipboard monitoring: %s", e)
+        
+        # Bind hot-loop lookups to locals once
+        paste = pyperclip.paste
+        copy = pyperclip.copy
+        sleep = time.sleep
+        monotonic = time.monotonic
+        logger = self.logger
+        process = self._process_clipboard_content
+        get_seq = _GetClipboardSequenceNumber
+        
+        # Pace polls against absolute deadlines so processing time doesn't add drift
+        deadline = monotonic()
+        
         while self.running:
             try:
+                # On Windows, only read the clipboard once its sequence number moves
+                changed = True
+                if get_seq is not None:
+                    seq = get_seq()
+                    changed = seq != self._last_seq
+                
                 # Get current clipboard content
-                current_content = pyperclip.paste()
+                current_content = paste() if changed else None
+                
+                # Check if clipboard content has changed
+                if current_content and current_content != self._last_content:
+                    self._last_content = current_content
+                    self._idle_interval = self.poll_interval
+                    logger.debug("Clipboard content changed, analyzing...")
+                    
+                    # Process the content
+                    redacted_content = process(current_content)
+                    
+                    if redacted_content:
+                        # Update clipboard with redacted content
+                        copy(redacted_content)
+                        self._last_content = redacted_content
+                        self._remember_redaction(redacted_content)
+                        if get_seq is not None:
+                            seq = get_seq()
+                        logger.info("Clipboard updated with redacted content")
+                else:
+                    self._idle_interval = min(self._max_interval, self._idle_interval * 1.25)
                 
-                if current_content:
-                    if ENABLE_CONTENT_HASHING:
-                        current_hash = self._get_clipboard_hash(current_content)
-                        
-                        # Check if clipboard content has changed
-                        if current_hash != self.last_clipboard_hash:
-                            self.last_clipboard_hash = current_hash
-                            self.logger.debug("Clipboard content changed, analyzing...")
-                            
-                            # Process the content
-                            redacted_content = self._process_clipboard_content(current_content)
-                            
-                            if redacted_content:
-                                # Update clipboard with redacted content
-                                pyperclip.copy(redacted_content)
-                                self.last_clipboard_hash = self._get_clipboard_hash(redacted_content)
-                                self.logger.info("Clipboard updated with redacted content")
-                    else:
-                        # Process without hashing (less efficient but simpler)
-                        redacted_content = self._process_clipboard_content(current_content)
-                        if redacted_content:
-                            pyperclip.copy(redacted_content)
-                            self.logger.info("Clipboard updated with redacted content")
+                # Only mark the change as handled once it was read and processed, so a
+                # failed paste() is retried on the next poll
+                if changed and get_seq is not None and self.running:
+                    self._last_seq = seq
                 
-                time.sleep(self.poll_interval)
+                deadline += self._idle_interval
+                sleep_for = deadline - monotonic()
+                if sleep_for > 0:
+                    sleep(sleep_for)
+                else:
+                    # Fell behind, restart the schedule from now
+                    deadline = monotonic()
                 
             except Exception as e:
-                self.logger.error(f"Error in clipboard monitoring: {e}")
-                time.sleep(1)  # Wait longer on error
+                logger.error("Error in clipboard monitoring: %s", e)
+                sleep(1)  # Wait longer on error
+                deadline = monotonic()
 
     def start(self):
         """Start the clipboard monitoring in a background thread"""
@@ -292,19 +863,59 @@ class ClipboardRedactor:
             return
         
         self.running = True
-        self.monitor_thread = threading.Thread(target=self._monitor_clipboard, daemon=True)
+        self.fatal_error = None
+        
+        # Load spaCy and Presidio now so the first clipboard change doesn't pay for it
+        threading.Thread(target=self._preload_engines, daemon=True).start()
+        
+        # Use clipboard change notifications on Windows, polling elsewhere
+        if sys.platform == 'win32':
+            self.listener = _WinClipboardListener(self._on_clipboard_update)
+            target = self._listen_clipboard
+        else:
+            self.listener = None
+            target = self._monitor_clipboard
+        
+        if SAVE_REDACTION_EXAMPLES:
+            self._examples_thread = threading.Thread(target=self._write_examples, daemon=True)
+            self._examples_thread.start()
+        
+        self.monitor_thread = threading.Thread(target=target, daemon=True)
         self.monitor_thread.start()
         self.logger.info("Clipboard redactor started successfully")
 
+    def _preload_engines(self):
+        """Background thread for start(): load the engines, halting loudly on failure"""
+        try:
+            self._ensure_engines()
+        except Exception as e:
+            self._halt(e)
+
     def stop(self):
         """Stop the clipboard monitoring"""
-        if not self.running:
+        # The monitor may already have halted itself after a fatal error; still clean up
+        if self.monitor_thread is None:
             self.logger.warning("Clipboard redactor is not running")
             return
         
         self.running = False
-        if hasattr(self, 'monitor_thread'):
-            self.monitor_thread.join(timeout=2)
+        listener = self.listener
+        if listener and not listener.stop():
+            self.logger.warning("Failed to signal the Win32 clipboard listener to stop")
+        self.monitor_thread.join(timeout=2)
+        self.monitor_thread = None
+        
+        # Let the writer flush queued examples before exiting
+        if self._examples_thread:
+            try:
+                self._examples_queue.put(None, timeout=2)
+                self._examples_thread.join(timeout=2)
+            except queue.Full:
+                self.logger.warning("Redaction example queue full, pending examples may be lost")
+            if self._examples_thread.is_alive():
+                self.logger.warning("Redaction example writer did not finish in time")
+            self._examples_thread = None
+        
         self.logger.info("Clipboard redactor stopped")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -333,6 +944,7 @@ class ClipboardRedactor:
         print(f"Total clipboard checks: {stats['total_checks']}")
         print(f"Redactions performed: {stats['redactions_performed']}")
         print(f"Average processing time: {stats['avg_processing_time']:.2f}ms")
+        print(f"Max processing time: {stats['max_processing_time']:.2f}ms")
         print(f"Checks per second: {stats['checks_per_second']:.2f}")
         print(f"Performance target: {stats['config']['performance_target_ms']}ms")
         print(f"PII entities monitored: {stats['config']['pii_entities_count']}")
@@ -359,12 +971,17 @@ def main():
         print("Copy some text with PII to test the redaction.")
         print("Press Ctrl+C to stop.")
         
-        # Keep the main thread alive
-        while True:
-            time.sleep(10)
+        # Keep the main thread alive until interrupted or the monitor halts
+        while redactor.monitor_thread.is_alive():
+            redactor.monitor_thread.join(timeout=10)
             # Print stats every 10 seconds in debug mode
             if redactor.logger.level <= logging.DEBUG:
                 redactor.print_stats()
+        
+        redactor.stop()
+        print(f"Clipboard redactor stopped: {redactor.fatal_error or 'monitor thread exited'}")
+        print("Clipboard content is NOT being redacted. Please check your configuration and dependencies.")
+        sys.exit(1)
                 
     except KeyboardInterrupt:
         print("\nShutting down clipboard redactor...")
@@ -48,7 +48,7 @@ def install_requirements():
 def download_spacy_model():
     """Download required spaCy model"""
     return run_command(
-        f"{sys.executable} -m spacy download en_core_web_sm",
+        f"{sys.executable} -m spacy download en_core_web_lg",
         "Downloading spaCy English model"
     )
 
@@ -63,7 +63,7 @@ def test_installation():
         import spacy
         
         # Test spaCy model
-        nlp = spacy.load("en_core_web_sm")
+        nlp = spacy.load("en_core_web_lg")
         
         # Test Presidio engines
         analyzer = AnalyzerEngine()
@@ -77,7 +77,7 @@ def test_installation():
         return False
     except OSError as e:
         print(f"ERROR: Model loading error: {e}")
-        print("Try running: python -m spacy download en_core_web_sm")
+        print("Try running: python -m spacy download en_core_web_lg")
         return False
     except Exception as e:
         print(f"ERROR: Unexpected error: {e}")
@@ -131,9 +131,8 @@ def main():
     print("SETUP COMPLETED SUCCESSFULLY!")
     print("\nNext steps:")
     print("1. Run the clipboard redactor: python main.py")
-    print("2. Test the functionality: python test_redactor.py")
-    print("3. For interactive testing: python test_redactor.py --interactive")
-    print("4. Use start_clipboard_redactor.bat for easy startup")
+    print("2. Test the functionality: python -m pytest test_redactor.py")
+    print("3. Use start_clipboard_redactor.bat for easy startup")
     print("\nFor automatic startup on Windows:")
     print("- Add start_clipboard_redactor.bat to Windows Task Scheduler")
     print("- Or add to Windows Startup folder")
@@ -17,7 +17,7 @@ python -c "import presidio_analyzer, presidio_anonymizer, pyperclip" 2>/dev/null
 if [ $? -ne 0 ]; then
     echo "ERROR: Dependencies not installed. Installing now..."
     pip install -r requirements.txt
-    python -m spacy download en_core_web_sm
+    python -m spacy download en_core_web_lg
 fi
 
 echo "SUCCESS: Environment ready. Starting clipboard redactor..."
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Tests for the Real-Time Clipboard Redactor
+Presidio's analyzer is replaced by a small regex stand-in so no spaCy model is needed
+"""
+
+import json
+import re
+import time
+
+import pytest
+from presidio_analyzer import RecognizerResult
+from presidio_anonymizer import AnonymizerEngine
+
+import main
+from main import ClipboardRedactor, _PII_PREFILTER
+
+
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[a-z]+")
+
+
+class StubAnalyzerEngine:
+    """Stand-in for AnalyzerEngine that only detects email addresses"""
+
+    def __init__(self):
+        self.calls = []
+
+    def analyze(self, text, language, entities=None, score_threshold=None, nlp_artifacts=None):
+        self.calls.append(text)
+        return [
+            RecognizerResult("EMAIL_ADDRESS", match.start(), match.end(), 1.0)
+            for match in EMAIL.finditer(text)
+        ]
+
+
+class StubBatchAnalyzerEngine:
+    """Stand-in for BatchAnalyzerEngine with the presidio-analyzer 2.2.354 signature"""
+
+    def __init__(self, analyzer_engine):
+        self.analyzer_engine = analyzer_engine
+
+    def analyze_iterator(self, texts, language, **kwargs):
+        return [self.analyzer_engine.analyze(text=text, language=language, **kwargs) for text in texts]
+
+
+FAST_ENTITIES = ["EMAIL_ADDRESS", "PHONE_NUMBER", "IP_ADDRESS", "CRYPTO"]
+
+
+def make_redactor(**kwargs):
+    """Redactor with stub analyzer engines"""
+    redactor = ClipboardRedactor(**kwargs)
+    analyzer = StubAnalyzerEngine()
+    redactor._analyzer_lazy = analyzer
+    redactor._anonymizer_lazy = AnonymizerEngine()
+    redactor._batch_analyzer_lazy = StubBatchAnalyzerEngine(analyzer_engine=analyzer)
+    return redactor
+
+
+@pytest.fixture(autouse=True)
+def spacy_model_installed(monkeypatch):
+    """Pretend Presidio's spaCy model is installed; the stub engines never load it"""
+    monkeypatch.setattr(main.spacy.util, "is_package", lambda name: True)
+
+
+@pytest.fixture
+def redactor(tmp_path, monkeypatch):
+    """Redactor using the default config, logging into a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return make_redactor()
+
+
+@pytest.fixture
+def fast_redactor(tmp_path, monkeypatch):
+    """Redactor whose configured entities are all covered by the regex fast path"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "PII_ENTITIES", FAST_ENTITIES)
+    return make_redactor()
+
+
+@pytest.mark.parametrize("text", [
+    "first para\n\n\n\nsecond para\n\nthird",
+    "first para\r\n\r\nsecond para\r\n  \r\nthird",
+])
+def test_split_paragraphs_offsets(text):
+    segments = ClipboardRedactor._split_paragraphs(text)
+
+    assert [segment for _, segment in segments] == ["first para", "second para", "third"]
+    for offset, segment in segments:
+        assert text[offset:offset + len(segment)] == segment
+
+
+def test_split_paragraphs_single():
+    assert ClipboardRedactor._split_paragraphs("just one line") == [(0, "just one line")]
+    assert ClipboardRedactor._split_paragraphs("  \n\n ") == []
+
+
+def test_multi_paragraph_results_are_shifted(redactor):
+    text = "Contact alice@example.com about the invoice.\n\nEscalations go to bob@example.org instead."
+    results = redactor._analyze_text(text)
+
+    assert sorted(text[r.start:r.end] for r in results) == ["alice@example.com", "bob@example.org"]
+
+
+def test_multi_paragraph_content_is_redacted(redactor):
+    filler = "Nothing sensitive in this sentence at all. " * 3
+    text = f"{filler}Reach Alice at alice@example.com.\n\n{filler}Or Bob at bob@example.org."
+    redacted = redactor._process_clipboard_content(text)
+
+    assert redacted == (
+        f"{filler}Reach Alice at [EMAIL_REDACTED].\n\n{filler}Or Bob at [EMAIL_REDACTED]."
+    )
+
+
+@pytest.mark.parametrize("text", [
+    "3/4/85",
+    "2024-01-15 10:30:00",
+    "March 3rd",
+    "3rd March",
+    "see you tomorrow at 5",
+    "call me at 5pm",
+])
+def test_prefilter_matches_dates(text):
+    assert _PII_PREFILTER.search(text)
+
+
+def test_prefilter_skips_plain_text():
+    assert not _PII_PREFILTER.search("ls -la /tmp && cd src && make clean")
+
+
+def test_short_content_always_analyzed(redactor):
+    redactor._process_clipboard_content("see you after lunch")
+    assert redactor._analyzer_lazy.calls == ["see you after lunch"]
+
+
+def test_long_content_without_candidates_skips_analysis(redactor):
+    redactor._process_clipboard_content("nothing to see here, just lowercase words. " * 10)
+    assert redactor._analyzer_lazy.calls == []
+
+
+def test_stop_flushes_queued_examples(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "SAVE_REDACTION_EXAMPLES", True)
+    redactor = make_redactor()
+    redactor._monitor_clipboard = lambda: None  # no clipboard access in tests
+
+    redactor.start()
+    for i in range(50):
+        redactor._save_redaction_example(f"original {i}", f"redacted {i}", ["EMAIL_ADDRESS"])
+    redactor.stop()
+
+    with open(tmp_path / main.EXAMPLES_FILE) as f:
+        examples = [json.loads(line) for line in f]
+    assert [example["redacted_text"] for example in examples] == [f"redacted {i}" for i in range(50)]
+    assert redactor._examples_thread is None
+
+
+def test_fast_path_disabled_for_default_entities(redactor):
+    content = "bob@x.com dob 03/04/1985"
+    redactor._process_clipboard_content(content)
+    assert redactor._analyzer_lazy.calls == [content]
+
+
+@pytest.mark.parametrize("text", [
+    "2024-01-15",
+    "2024-01-15 10:30:00",
+    "order 1234567890",
+    "commit 1f9a4c2b7d5e6f1a8b9c3d4e5f6a7b8c9d1e2f3a",
+    "commit 3f9a4c2b7d5e6f1a8b9c3d4e5f6a7b8c9d1e2f3a",
+    "bc1f9a4c2d7d5e6f2a8e9c3d4e5f6a7d8c9d2e2f3a",
+    "send to 1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN3",  # bad checksum
+])
+def test_fast_redact_ignores_lookalikes(fast_redactor, text):
+    assert fast_redactor._fast_redact(text) == (text, [])
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("mail me: a.b@example.com", "mail me: [EMAIL_REDACTED]"),
+    ("call 555-123-4567.", "call [PHONE_REDACTED]."),
+    ("call +1 (555) 123-4567", "call [PHONE_REDACTED]"),
+    ("server 192.168.1.100 up", "server [IP_REDACTED] up"),
+    ("send to 1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2", "send to [CRYPTO_REDACTED]"),
+    ("send to 0x52908400098527886E0F7030069857D2E4169EE7", "send to [CRYPTO_REDACTED]"),
+])
+def test_fast_path_redacts_without_presidio(fast_redactor, text, expected):
+    assert fast_redactor._process_clipboard_content(text) == expected
+    assert fast_redactor._analyzer_lazy.calls == []
+
+
+def test_fast_path_falls_back_on_leftover_numbers(fast_redactor):
+    content = "mail a@example.com or call 5551234567"
+    fast_redactor._process_clipboard_content(content)
+    assert fast_redactor._analyzer_lazy.calls == [content]
+
+
+def test_missing_spacy_model_fails_at_startup(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main.spacy.util, "is_package", lambda name: False)
+    with pytest.raises(RuntimeError, match="spacy download"):
+        ClipboardRedactor()
+
+
+def test_engine_failure_halts_monitor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    redactor = ClipboardRedactor()
+
+    def broken_engine():
+        raise OSError("model failed to load")
+
+    content = "Reach Alice Smith at alice@example.com"
+    monkeypatch.setattr(main, "AnalyzerEngine", broken_engine)
+    monkeypatch.setattr(main.pyperclip, "paste", lambda: content)
+    monkeypatch.setattr(main.pyperclip, "copy", lambda text: None)
+
+    redactor.start()
+    redactor.monitor_thread.join(timeout=5)
+
+    assert not redactor.monitor_thread.is_alive()
+    assert not redactor.running
+    assert isinstance(redactor.fatal_error, OSError)
+    # The unredacted clip is not remembered, so a restart analyzes it again
+    assert redactor._last_content == ""
+    redactor.stop()
+
+
+
+def test_start_loads_engines_in_background(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "AnalyzerEngine", StubAnalyzerEngine)
+    monkeypatch.setattr(main, "BatchAnalyzerEngine", StubBatchAnalyzerEngine)
+    redactor = ClipboardRedactor()
+    redactor._monitor_clipboard = lambda: None  # no clipboard access in tests
+    assert redactor._analyzer_lazy is None
+
+    redactor.start()
+    for _ in range(100):
+        if redactor._analyzer_lazy is not None and redactor._analyzer_lazy.calls:
+            break
+        time.sleep(0.02)
+    redactor.stop()
+
+    # Loaded and warmed up without any clipboard content arriving
+    assert redactor._analyzer_lazy.calls == ["John Doe john@example.com 555-123-4567"]
+
+
+class FlakyClipboard:
+    """Clipboard stand-in whose first paste() calls fail, as when another app holds it open"""
+
+    def __init__(self, content, failures):
+        self.content = content
+        self.failures = failures
+        self.copied = []
+
+    def paste(self):
+        if self.failures:
+            self.failures -= 1
+            raise main.pyperclip.PyperclipException("OpenClipboard failed")
+        return self.content
+
+    def copy(self, text):
+        self.copied.append(text)
+        self.content = text
+
+
+def test_poll_retries_after_failed_paste(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    redactor = make_redactor(poll_interval=0.01)
+    # One failure for the priming paste() at loop start, one for the first poll
+    clipboard = FlakyClipboard("alice@example.com", failures=2)
+    monkeypatch.setattr(main.pyperclip, "paste", clipboard.paste)
+    monkeypatch.setattr(main.pyperclip, "copy", clipboard.copy)
+    monkeypatch.setattr(main, "_GetClipboardSequenceNumber", lambda: 7)
+
+    redactor.start()
+    for _ in range(100):
+        if clipboard.copied:
+            break
+        time.sleep(0.02)
+    redactor.stop()
+
+    assert clipboard.copied == ["[EMAIL_REDACTED]"]
+
+
+def test_listener_retries_after_failed_paste(redactor, monkeypatch):
+    clipboard = FlakyClipboard("alice@example.com", failures=1)
+    monkeypatch.setattr(main.pyperclip, "paste", clipboard.paste)
+    monkeypatch.setattr(main.pyperclip, "copy", clipboard.copy)
+    monkeypatch.setattr(main, "_GetClipboardSequenceNumber", lambda: 7)
+    redactor.running = True
+
+    redactor._on_clipboard_update()
+    assert clipboard.copied == []
+    assert redactor._last_seq != 7
+
+    redactor._on_clipboard_update()
+    assert clipboard.copied == ["[EMAIL_REDACTED]"]
+
+
+class OverlappingAnalyzerEngine(StubAnalyzerEngine):
+    """Stub that also reports each email's local part, which the anonymizer merges into the email"""
+
+    def analyze(self, text, language, entities=None, score_threshold=None, nlp_artifacts=None):
+        results = super().analyze(text, language, entities, score_threshold, nlp_artifacts)
+        return results + [
+            RecognizerResult("EMAIL_ADDRESS", r.start, text.index("@", r.start), 0.5) for r in results
+        ]
+
+
+def test_cached_results_survive_anonymization(redactor):
+    analyzer = OverlappingAnalyzerEngine()
+    redactor._analyzer_lazy = analyzer
+    redactor._batch_analyzer_lazy = StubBatchAnalyzerEngine(analyzer_engine=analyzer)
+    content = "Write to alice@example.com today"
+
+    first = redactor._process_clipboard_content(content)
+    second = redactor._process_clipboard_content(content)
+
+    assert first == second == "Write to [EMAIL_REDACTED] today"
+    assert analyzer.calls == [content]
+    # The anonymizer widens merged results in place; the cached copies must keep their spans
+    spans = [(r.start, r.end, r.score) for r in redactor._analyze_text(content)]
+    assert spans == [(9, 26, 1.0), (9, 14, 0.5)]